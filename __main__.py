@@ -1,27 +1,57 @@
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
 from enum import Enum
 from pathlib import Path
-import random
-import shlex
+from typing import TYPE_CHECKING
+import re
 import time
 import subprocess
-import winsound
-import pyttsx3
+import sys
 import os
 
-from config_type import BuildAutomatorConfig, build_automator_load_config
+# pyttsx3, winsound and random are imported on first use, pyttsx3 alone loads COM/SAPI
+if TYPE_CHECKING:
+    import pyttsx3
+
+# optional, lets us skip taskkill when Unreal isn't running
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from config_type import BuildAutomatorConfig, build_automator_load_config, iter_file_entries, path_kind
 
 
 #==============================================================================
 # DEFAULTS
 
 PROGRAM_NAME = "Build Automator"
+UNREAL_EDITOR_EXES = ("UnrealEditor.exe", "UnrealEditor-Cmd.exe")
 VERBOSE_SOUND_DEBUG = False
+UAT_OUTPUT_CHUNK_SIZE = 64 * 1024
+SVN_LOG_SEPARATOR = "-" * 72
+SVN_UPDATE_REVISION_PATTERN = re.compile(r"(?:Updated to|At) revision (\d+)")
+SVN_VERSION_PATTERN = re.compile(r"\d+")
 
 #==============================================================================
 # HELPERS
 
-def _make_line():
-    return "".join('-' for _ in range(80))
+_LINE = "-" * 80
+
+
+def _dir_size_reaches(path: Path, size_in_bytes: int) -> bool:
+    """Sums file sizes under path, stopping as soon as size_in_bytes is reached."""
+
+    total: int = 0
+    for entry in iter_file_entries(path):
+        try:
+            total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+
+        if total >= size_in_bytes:
+            return True
+
+    return False
 
 #==============================================================================
 # PROCESSES
@@ -30,6 +60,53 @@ def _sh(cmd: list[str]):
     return subprocess.run(cmd, text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
 
 
+def _sh_fire(cmd: list[str]):
+    """Runs cmd discarding its output, without opening a console window."""
+
+    return subprocess.run(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)
+        )
+
+
+def _tee_output(fd: int, log_file: Path | None = None):
+    """Relays raw output chunks from fd to stdout and, if given, to log_file."""
+
+    sys.stdout.flush()
+    stdout = sys.stdout.buffer
+
+    log_fh = None
+    if log_file:
+        try:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            log_fh = open(log_file, "wb")
+        except OSError as e:
+            print("Can't write build log file:", e)
+
+    # bound once, this loop runs for the whole build
+    read = os.read
+    write = stdout.write
+    flush = stdout.flush
+    log_write = log_fh.write if log_fh else None
+
+    try:
+        while True:
+            chunk = read(fd, UAT_OUTPUT_CHUNK_SIZE)
+            if not chunk:
+                break
+
+            _ = write(chunk)
+            flush()
+            if log_write:
+                _ = log_write(chunk)
+    finally:
+        if log_fh:
+            log_fh.close()
+
+
 #==============================================================================
 # SVN COMMANDS
 
@@ -63,15 +140,63 @@ def svn_cleanup(config: BuildAutomatorConfig) -> bool:
     return out.returncode == 0
 
 
+def svn_has_unversioned_entries(config: BuildAutomatorConfig) -> bool:
+    """Returns True if the working copy has unversioned or ignored entries (or the check failed)."""
+
+    out = _sh_svn(config, ["status", "--no-ignore"])
+    if out.returncode != 0:
+        print(out.stdout)
+        return True
+
+    # first column: "?" unversioned, "I" ignored
+    return any(line[:1] in ("?", "I") for line in out.stdout.splitlines())
+
+
+def svn_should_cleanup(config: BuildAutomatorConfig) -> bool:
+    """Returns False only when the working copy is clean: a small pristine store and
+    no unversioned or ignored entries left for cleanup to remove."""
+
+    min_size_in_mb: int = config.svn.cleanup_min_pristine_size_in_mb
+    if min_size_in_mb <= 0:
+        return True
+
+    pristine_path: Path = config.project.path / ".svn" / "pristine"
+    if _dir_size_reaches(pristine_path, min_size_in_mb * 1024 * 1024):
+        return True
+
+    return svn_has_unversioned_entries(config)
+
+
 def svn_revision(config: BuildAutomatorConfig) -> int:
     """Returns the revision number."""
 
-    out = _sh_svn(config, ["info", "--show-item", "revision"])
+    out = _sh_svn(config, ["info", "--show-item", "revision", "--no-newline"])
     if out.returncode != 0:
         print(out.stdout)
         raise RuntimeError("svn info failed")
 
-    return int(out.stdout.strip())
+    return int(out.stdout)
+
+
+def svn_working_revision(config: BuildAutomatorConfig) -> int:
+    """Returns the working copy revision using svnversion, which only reads local metadata."""
+
+    svn_exe: Path = config.svn.exe
+    svnversion_exe: Path = svn_exe.with_name(f"svnversion{svn_exe.suffix}")
+
+    try:
+        out = _sh([str(svnversion_exe), str(config.project.path)])
+    except OSError as e:
+        print("svnversion failed:", e)
+        return svn_revision(config)
+
+    # "4123", "4123M" or a mixed "4120:4123M", the first number is the lowest one; like the root
+    # revision svn info reports, it doesn't hide a half finished update behind its newest files
+    found = SVN_VERSION_PATTERN.match(out.stdout.strip())
+    if out.returncode != 0 or not found:
+        return svn_revision(config)
+
+    return int(found.group(0))
 
 
 def svn_log(config: BuildAutomatorConfig, revision_num: int) -> str:
@@ -79,33 +204,68 @@ def svn_log(config: BuildAutomatorConfig, revision_num: int) -> str:
     return out.stdout
 
 
-def svn_update(config: BuildAutomatorConfig) -> bool:
-    """Returns True if the working copy changed (moved to a new rev)."""
+def svn_log_range(config: BuildAutomatorConfig, revision_start: int, revision_end: int) -> list[str]:
+    """Returns one log entry per revision between start and end (inclusive)."""
+
+    out = _sh_svn(config, ["log", "--revision", f"{revision_start}:{revision_end}"])
+    if out.returncode != 0:
+        # logs are only informative, a failure must not drop the build of this revision
+        print(out.stdout)
+        print("⚠️ svn log failed, building without logs")
+        return []
+
+    logs: list[str] = []
+    for entry in out.stdout.split(SVN_LOG_SEPARATOR):
+        entry = entry.strip()
+        if entry:
+            logs.append(entry)
+
+    return logs
+
+
+def svn_update(config: BuildAutomatorConfig, known_revision: int = -1) -> tuple[bool, int]:
+    """Returns whether the working copy changed (moved to a new rev) and the current revision.
+
+    known_revision is the revision returned by the previous update, only queried when unknown (-1)."""
 
     print("Updating SVN at", config.project.path)
-    before = svn_revision(config)
+    before = known_revision if known_revision != -1 else svn_working_revision(config)
 
-    out = _sh_svn(config, ["update"])
+    out = _sh_svn(config, ["update", "--non-interactive"])
 
     if out.returncode != 0:
         print(out.stdout)
         raise RuntimeError("svn update failed")
 
-    after = svn_revision(config)
+    # "Updated to revision N." / "At revision N.", the last one is the working copy root
+    updated_revisions: list[str] = SVN_UPDATE_REVISION_PATTERN.findall(out.stdout)
+    after = int(updated_revisions[-1]) if updated_revisions else svn_revision(config)
     if after > before:
         print(f"✅ SVN updated: {before} -> {after}")
-        return True
+        return True, after
 
     print(f"No remote changes. At revision {after}\n...\n")
-    return False
+    return False, after
 
 
 #==============================================================================
 # UNREAL AUTOMATION TOOL COMMANDS
 
 def unreal_kill_process_if_running():
-    for exe in ("UnrealEditor.exe", "UnrealEditor-Cmd.exe"):
-        _ = _sh(["taskkill", "/IM", exe, "/F", "/T"])
+    exes: list[str] = list(UNREAL_EDITOR_EXES)
+
+    if psutil:
+        running: set[str] = {process.info["name"] for process in psutil.process_iter(["name"])}
+        exes = [exe for exe in exes if exe in running]
+        if not exes:
+            return
+
+    # a single taskkill for every image name
+    cmd: list[str] = ["taskkill", "/F", "/T"]
+    for exe in exes:
+        cmd += ["/IM", exe]
+
+    _ = _sh_fire(cmd)
 
 
 def unreal_run_automation_tool(
@@ -114,9 +274,10 @@ def unreal_run_automation_tool(
     platform: str = "Win64",
     build_type: str = "Shipping",
     archive_dir: Path | None = None,
-    extra_args: str | None = None
+    extra_args: list[str] | None = None,
+    log_file: Path | None = None
 ) -> int:
-    """Call Unreal AutomationTool (BuildCookRun)"""
+    """Call Unreal AutomationTool (BuildCookRun), teeing its output to log_file if given"""
 
     # building for windows
     cmd = [
@@ -134,11 +295,11 @@ def unreal_run_automation_tool(
         cmd += ["-archive", f"-archivedirectory={archive_dir}"]
 
     if extra_args:
-        cmd += (extra_args if isinstance(extra_args, list) else shlex.split(extra_args))
+        cmd += extra_args
 
     print(
-        _make_line(),
-        "\n🚀 Building:", " ".join(shlex.quote(c) for c in cmd)
+        _LINE,
+        "\n🚀 Building:", subprocess.list2cmdline(cmd)
     )
 
     use_shell = str(uat_path).lower().endswith((".bat", ".cmd"))
@@ -148,15 +309,10 @@ def unreal_run_automation_tool(
         shell=use_shell,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        bufsize=1,
-        universal_newlines=True,
-        encoding="utf-8",
-        env=os.environ.copy()
+        bufsize=0
     ) as proc:
-        output = proc.stdout
-        if output:
-            for line in output:
-                print(line, end="", flush=True)
+        if proc.stdout:
+            _tee_output(proc.stdout.fileno(), log_file)
 
         return proc.wait()
 
@@ -173,19 +329,21 @@ def unreal_build_project(config: BuildAutomatorConfig) -> UnrealBuildResponse:
             config.project.uproject,
             config.uat.platform,
             config.uat.build_type,
-            config.uat.output
+            config.uat.output,
+            config.uat.extra_args,
+            log_file=config.uat.build_log_file
             )
 
         if result_code != 0:
             print(
-                _make_line(),
+                _LINE,
                 "\n❌ Build failed!")
             print("Exit code:", result_code)
             return UnrealBuildResponse.FAILED
 
     except subprocess.CalledProcessError as e:
         print(
-            _make_line(),
+            _LINE,
             "\n❌ Process failed!")
         print("Exit code:", e.returncode)
         print("output:\n", e.output if hasattr(e, "output") else "(no output)")
@@ -193,7 +351,7 @@ def unreal_build_project(config: BuildAutomatorConfig) -> UnrealBuildResponse:
 
     except Exception as e:
         print(
-            _make_line(),
+            _LINE,
             "\n⚠️ Unexpected error during build:", e)
         return UnrealBuildResponse.UNEXPECTED_ERROR
 
@@ -203,60 +361,49 @@ def unreal_build_project(config: BuildAutomatorConfig) -> UnrealBuildResponse:
 #==============================================================================
 # SOUNDS
 
-def _sound_find_sounds_on_path(path: Path) -> list[Path]:
-    if not path.exists():
-        return []
+def _sound_play_file(path: Path):
+    import winsound
 
-    found_sounds: list[Path] = []
+    # paths come pre-resolved from the config, SND_NODEFAULT keeps a since deleted file silent
+    try:
+        winsound.PlaySound(str(path), winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
+    except RuntimeError as e:
+        print(f"Failed to play sound {path}:", e)
 
-    if path.is_dir():
-        for root, _, files in path.walk():
-            for file in files:
-                file = Path(file)
-                if file.suffix == ".wav":
-                    found_sounds.append(root / file)
 
-    return found_sounds
+_tts_engine: "pyttsx3.Engine | None" = None
 
+def _sound_get_tts_engine() -> "pyttsx3.Engine":
+    global _tts_engine
+    if _tts_engine is None:
+        import pyttsx3
+        _tts_engine = pyttsx3.init()
 
-def _sound_play_file(path: Path):
-    if path.exists():
-        winsound.PlaySound(str(path), winsound.SND_FILENAME | winsound.SND_ASYNC)
+    return _tts_engine
 
 
 def sound_say(text: str):
-    engine = pyttsx3.init()
+    engine = _sound_get_tts_engine()
     _ = engine.say(text)
     _ = engine.runAndWait()
 
 
-def sound_play_random(sounds: list[Path] | Path):
-    if VERBOSE_SOUND_DEBUG:
-        print(f"Selecting sound from {sounds}...")
+def sound_beep():
+    import winsound
+    winsound.MessageBeep()
 
-    if isinstance(sounds, list):
-        if len(sounds) < 1:
-            print("No sound found on", sounds)
-            return
-        possible_sound_paths: Path = random.choice(sounds)
-    else:
-        possible_sound_paths = sounds
 
-    if not possible_sound_paths.exists():
-        print(f"Sound path {possible_sound_paths} do not exists.")
-        return
+def sound_play_random(sounds: list[Path]):
+    import random
 
-    if possible_sound_paths.is_dir():
-        found_sounds: list[Path] = _sound_find_sounds_on_path(possible_sound_paths)
-        if len(found_sounds) < 1:
-            print("No sound found on", possible_sound_paths)
-            return
+    if VERBOSE_SOUND_DEBUG:
+        print(f"Selecting sound from {sounds}...")
 
-        selected_sound = random.choice(found_sounds)
-        _sound_play_file(selected_sound)
+    if len(sounds) < 1:
+        print("No sound found!")
         return
 
-    _sound_play_file(possible_sound_paths)
+    _sound_play_file(random.choice(sounds))
 
 
 #==============================================================================
@@ -265,27 +412,22 @@ def sound_play_random(sounds: list[Path] | Path):
 def log_find_commands(config: BuildAutomatorConfig, log: str) -> list[str]:
     """Returns the list of commands found on log"""
 
-    found_commands: list[str] = []
-    all_commands: list[str] = config.special_log_keywords.all_commands
-
-    for command in all_commands:
-        if log.find(command) != -1:
-            found_commands.append(command)
-
-    return found_commands
+    pattern = config.special_log_keywords.pattern
+    return list(dict.fromkeys(match.group(0) for match in pattern.finditer(log)))
 
 
 #==============================================================================
 # Directory Structuring
 
-def _compact_file(file_path: Path, should_override: bool, new_name: str | None = None, output_path: Path | None = None) -> Path | None:
+def _compact_file(file_path: Path, should_override: bool, new_name: str | None = None, output_path: Path | None = None, compression_args: list[str] | None = None) -> Path | None:
     """Returns the compacted file."""
 
-    if not file_path.exists():
+    file_path_kind: str | None = path_kind(file_path)
+    if not file_path_kind:
         print(f"{file_path.name} does not exists!")
         return None
 
-    if not file_path.is_dir():
+    if file_path_kind != "dir":
         print(f"{file_path.name} is not a directory!")
         return None
 
@@ -300,18 +442,29 @@ def _compact_file(file_path: Path, should_override: bool, new_name: str | None =
 
     zip_path = out_path / zip_name
 
-    print(_make_line())
+    print(_LINE)
 
-    if zip_path.exists():
-        if not should_override:
-            return zip_path
-        else:
+    if should_override:
+        try:
             zip_path.unlink()
             print(f"Overriding existing zip: {zip_path}")
+        except FileNotFoundError:
+            pass
+
+    elif path_kind(zip_path):
+        return zip_path
 
     print(f"Compacting {file_path} -> {zip_path}...")
-    cmd = ["7z", "a", str(zip_path), str(file_path)]
-    _ = _sh(cmd)
+    cmd = ["7z", "a", "-tzip"]
+    if compression_args:
+        cmd.extend(compression_args)
+    cmd += [str(zip_path), str(file_path)]
+    out = _sh(cmd)
+
+    if out.returncode != 0:
+        print(out.stdout)
+        print("7z failed! Exit code:", out.returncode)
+        return None
 
     return zip_path
 
@@ -323,52 +476,106 @@ def build_find(config: BuildAutomatorConfig) -> Path:
 
 
 def build_dump_log_file(dir: Path, logs: list[str]):
-    if not dir.exists():
+    dir_kind: str | None = path_kind(dir)
+    if not dir_kind:
         print("Can't dump log file, path doesn't exists:", dir)
 
-    if not dir.is_dir():
+    elif dir_kind != "dir":
         print("Can't dump log file, is NOT directory:", dir)
 
-    final_text: str = ""
-    for log in logs:
-        final_text += f"{log}\n\n"
-
     log_text_file: Path = dir / "svn_logs.txt"
 
-    _ = log_text_file.write_text(final_text)
+    _ = log_text_file.write_text("\n\n".join(logs) + "\n")
 
 
 def build_compact(config: BuildAutomatorConfig, build: Path, new_build_name: str):
     final_build_path: Path = config.build_export.output
     temp_name: str = f"{new_build_name} TRANSFERING..."
 
-    compacted_file: Path | None = _compact_file(build, config.build_export.override_zip, temp_name, final_build_path)
+    compacted_file: Path | None = _compact_file(
+        build,
+        config.build_export.override_zip,
+        temp_name,
+        final_build_path,
+        config.build_export.compression_args
+        )
+
+    if not compacted_file:
+        return
 
-    if compacted_file and compacted_file.exists():
-        new_name_path = compacted_file.parent / f"{new_build_name}{compacted_file.suffix}"
+    new_name_path = compacted_file.parent / f"{new_build_name}{compacted_file.suffix}"
+    try:
         renamed_file = compacted_file.rename(new_name_path)
+    except FileNotFoundError:
+        print("Compacted file not found:", compacted_file)
+        return
+
+    print(f"Compacted file renamed from {str(compacted_file)} to {str(renamed_file)}")
+
+
+# single worker so archives never compete for the disk, keyed by build name
+_archive_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="archive")
+_pending_archives: dict[str, Future[None]] = {}
+
+def build_compact_async(config: BuildAutomatorConfig, build: Path, new_build_name: str) -> Future[None]:
+    """Compacts the build on the background, returns the already pending archive for the same name."""
+
+    pending = _pending_archives.get(new_build_name)
+    if pending and not pending.done():
+        return pending
+
+    future = _archive_executor.submit(build_compact, config, build, new_build_name)
+    _pending_archives[new_build_name] = future
+    return future
+
+
+def build_poll_archives():
+    """Forgets finished archives, reporting the failed ones."""
 
-        print(f"Compacted file renamed from {str(compacted_file)} to {str(renamed_file)}")
+    for new_build_name, future in list(_pending_archives.items()):
+        if not future.done():
+            continue
+
+        del _pending_archives[new_build_name]
+        error = future.exception()
+        if error:
+            print(f"⚠️ Failed to compact {new_build_name}:", error)
+
+
+def build_wait_archives():
+    """Blocks until every pending archive is done, the build directory is reused by the next build."""
+
+    if _pending_archives:
+        print("Waiting for pending archives...")
+        _ = wait_futures(list(_pending_archives.values()))
+
+    build_poll_archives()
 
 
 #==============================================================================
 # Main
 
+def _wait_until(deadline: float):
+    """Sleeps until the monotonic deadline, returning at once if it already passed."""
+
+    time.sleep(max(0.0, deadline - time.monotonic()))
+
+
 def build_dump_logs_and_compact(config: BuildAutomatorConfig, logs: list[str], revision_num: int) -> bool:
     print("Change detected... Starting build!")
-    sound_play_random(config.sounds.build_starting)
+    sound_play_random(config.sounds.build_starting_files)
     sound_say("Começando a buildar!")
 
     unreal_kill_process_if_running()
     build_result = unreal_build_project(config)
 
     if build_result == UnrealBuildResponse.UNEXPECTED_ERROR:
-        sound_play_random(config.sounds.build_unknown_error)
+        sound_play_random(config.sounds.build_unknown_error_files)
         sound_say("Erro inesperado durante build!")
         return False
 
     elif build_result == UnrealBuildResponse.FAILED:
-        sound_play_random(config.sounds.build_fail)
+        sound_play_random(config.sounds.build_fail_files)
         sound_say("Build falha, melhore!")
         return False
 
@@ -378,7 +585,7 @@ def build_dump_logs_and_compact(config: BuildAutomatorConfig, logs: list[str], r
         build_dump_log_file(last_build, logs)
 
     new_build_name = f"[{revision_num}] {config.project.filename} ({config.uat.build_type})"
-    build_compact(config, last_build, new_build_name)
+    _ = build_compact_async(config, last_build, new_build_name)
     return True
 
 
@@ -386,27 +593,33 @@ def _run():
     config = BuildAutomatorConfig() # start empty
 
     last_built_revision: int = -1
+    last_updated_revision: int = -1
     last_cleanup_time: float = -1.0
 
     while True:
         try:
-            current_time = time.time()
+            current_time = time.monotonic()
 
             def wait(config: BuildAutomatorConfig):
-                time.sleep(config.svn.update_interval_in_seconds)
+                # counted from the start of this iteration, so time spent building is not added on top
+                _wait_until(current_time + config.svn.update_interval_in_seconds)
 
             new_config: BuildAutomatorConfig | None = build_automator_load_config()
             if not new_config or not new_config.is_valid():
+                config.clear_validation_cache() # kept from an earlier poll, its paths may have changed since
                 if not config.is_valid():
                     wait_time_in_seconds: int = 10
                     print("Incomplete config data:\n")
                     print(config.get_invalid_configs_string(), "\n")
                     print(f"trying again in {wait_time_in_seconds}s\n...")
-                    time.sleep(wait_time_in_seconds)
+                    _wait_until(current_time + wait_time_in_seconds)
                     continue
 
                 print("New configuration is invalid, ignoring...")
             else:
+                if new_config.project.path != config.project.path:
+                    last_updated_revision = -1 # different working copy
+
                 config = new_config
 
             if config.should_print_configs:
@@ -417,23 +630,31 @@ def _run():
             cleanup_time_difference: float = current_time - last_cleanup_time if last_cleanup_time != -1.0 else 0.0
             #print(f"cleanup time in seconds: {config.svn.cleanup_timeout_in_seconds} | cleanup time diff: {cleanup_time_difference}")
             if last_cleanup_time == -1 or cleanup_time_difference >= config.svn.cleanup_timeout_in_seconds:
-                print(_make_line(), "\nCLEANUP TIME!\n")
-                if svn_cleanup(config):
+                print(_LINE, "\nCLEANUP TIME!\n")
+                if not svn_should_cleanup(config):
+                    print("Working copy is clean, skipping cleanup.")
+                    last_cleanup_time = current_time
+
+                elif svn_cleanup(config):
                     last_cleanup_time = current_time
                 else:
-                    winsound.MessageBeep()
+                    sound_beep()
                     sound_say("Falha ao limpar projeto!")
                     print("Cleanup failed!")
                     wait(config)
                     continue
 
-            has_revision_changed: bool = svn_update(config)
-            current_revision: int = svn_revision(config)
+            has_revision_changed, current_revision = svn_update(config, last_updated_revision)
+            last_updated_revision = current_revision
 
             if last_built_revision == -1:
                 last_built_revision = current_revision
 
+            build_poll_archives()
+
             if has_revision_changed:
+                build_wait_archives()
+
                 max_num_relevant_logs: int = config.build_export.max_num_relevant_logs
                 num_revisions_betwen_last_and_new: int = max(0, min(max_num_relevant_logs, current_revision - last_built_revision))
 
@@ -441,7 +662,7 @@ def _run():
 
                 logs: list[str] = []
                 if max_num_relevant_logs > 0 and num_revisions_betwen_last_and_new > 0:
-                    print(_make_line())
+                    print(_LINE)
 
                     print("Num revisions between last and new:", num_revisions_betwen_last_and_new)
 
@@ -453,13 +674,11 @@ def _run():
                     found_commands: list[str] = []
 
                     print("\nLOGS:")
-                    for revision_num in range(revision_start, revision_end + 1):
-                        revision_log: str = svn_log(config, revision_num)
+                    for revision_log in svn_log_range(config, revision_start, revision_end):
                         commands_on_log: list[str] = log_find_commands(config, revision_log)
 
                         found_commands.extend(commands_on_log)
 
-                        print("revision", revision_num)
                         print(revision_log)
                         logs.append(revision_log)
 
@@ -487,8 +706,8 @@ def _run():
                         continue
 
                 # dump steam_appid.txt
-                print(_make_line(), f"\n🍆 Build completed for r{current_revision}!")
-                sound_play_random(config.sounds.build_success)
+                print(_LINE, f"\n🍆 Build completed for r{current_revision}!")
+                sound_play_random(config.sounds.build_success_files)
                 sound_say(f"Build {config.uat.build_type} completada!")
 
                 last_built_revision = current_revision
@@ -496,6 +715,7 @@ def _run():
             wait(config)
 
         except KeyboardInterrupt:
+            build_wait_archives()
             print(f"{PROGRAM_NAME} Finished!")
             return
 
@@ -1,9 +1,21 @@
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, get_type_hints, override
 
-import tomllib
+import os
+import re
+import shlex
+import stat
+
 from warnings import warn
 
+# optional native TOML parser, same loads() API as tomllib
+try:
+    import rtoml as _toml_backend
+except ImportError:
+    import tomllib as _toml_backend
+
 
 #==============================================================================
 # DEFAULTS
@@ -13,6 +25,7 @@ DEFAULT_BUILD_NAME: str = "Windows"
 DEFAULT_BUILD_TYPE: str = "Shipping"
 BIN_DIR: str = "./bin"
 DEFAULT_BUILD_OUTPUT_DIRECTORY: str = "./builds"
+DEFAULT_COMPRESSION_LEVEL: int = 3
 
 def _get_default_build_platform() -> str:
     return "Win64"
@@ -29,13 +42,25 @@ def get_default_svn_path() -> str:
 
 _RawConfig = dict[str, Any]
 
+@lru_cache(maxsize=4)
+def _load_config_cached(path: str, _mtime_ns: int, _size: int) -> _RawConfig:
+    """Parses the config file, the stat fields are only part of the cache key.
+
+    Raises on failure, so only successful parses are cached."""
+
+    with open(path, "rb") as f:
+        return _toml_backend.loads(f.read().decode("utf-8"))
+
+
 def _load_config(path: Path) -> _RawConfig | None:
+    """Parses the config file, reusing the last result while it is unmodified."""
+
     try:
-        with open(path, "rb") as f:
-            config = tomllib.load(f)
-        return config
+        path_stat = os.stat(path)
+        return _load_config_cached(str(path), path_stat.st_mtime_ns, path_stat.st_size)
 
-    except:
+    except Exception as e:
+        print(f"Failed to load config {path}:", e)
         return None
 
 
@@ -43,40 +68,77 @@ def _get_config(config: _RawConfig | None, category: str, property: str) -> None
     if not config:
         return None
 
-    config_category = config.get(category, None)
+    config_category = config.get(category)
+
+    # a category written as a plain value instead of a table has no properties
+    return config_category.get(property) if isinstance(config_category, dict) else None
+
 
-    if not config_category or not isinstance(config_category, dict):
+def _get_paths(possible_paths: list[str] | str) -> list[Path]:
+    if isinstance(possible_paths, str):
+        possible_paths = [possible_paths]
+
+    return [Path(path).resolve() for path in possible_paths]
+
+
+def path_kind(path: Path) -> str | None:
+    """Returns "dir", "file" or None (missing or anything else) from a single stat call."""
+
+    try:
+        mode: int = os.stat(path).st_mode
+    except (OSError, ValueError):
         return None
 
-    return config_category.get(property, None)
+    if stat.S_ISDIR(mode):
+        return "dir"
+
+    if stat.S_ISREG(mode):
+        return "file"
+
+    return None
+
 
+def iter_file_entries(root: Path | str) -> Iterator[os.DirEntry[str]]:
+    """Yields the scandir entry of every file under root, without following symlinks.
 
-def _get_path_or_paths(possible_path: str | list[str]) -> Path | list[Path]:
-    if isinstance(possible_path, list):
-        out_paths: list[Path] = []
-        for path in possible_path:
-            out_paths.append(Path(path).resolve())
+    Files directly inside a directory are yielded before any of its subdirectories is entered,
+    so files on root itself always come first."""
 
-        return out_paths
+    stack: list[str] = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
+            continue
 
-    return Path(possible_path).resolve()
+
+def iter_files_ext(root: Path | str, ext: str) -> Iterator[str]:
+    """Yields the path of every file under root ending with ext, root files first."""
+
+    for entry in iter_file_entries(root):
+        if entry.name.endswith(ext):
+            yield entry.path
 
 
 def try_find_uproject_path(project_path: Path) -> Path | None:
-    if not project_path.exists():
+    project_path_kind: str | None = path_kind(project_path)
+    if not project_path_kind:
         print(f"Project path '{project_path}' doens't exist!")
         return None
 
-    if not project_path.is_dir():
+    if project_path_kind != "dir":
         print(f"Project path '{project_path}' is not a directory!")
         return None
 
-    for root, _, files in project_path.walk():
-        for file in files:
-            file = Path(file)
-            if file.suffix == ".uproject":
-                path = (root / file).resolve()
-                return path
+    # the .uproject normally sits on the project root, which is scanned first
+    uproject_path: str | None = next(iter_files_ext(project_path, ".uproject"), None)
+    if uproject_path:
+        return Path(uproject_path).resolve()
 
     print(f"Could not find .uproject on {project_path}")
     return None
@@ -108,6 +170,9 @@ class _BA_Config:
 # PROJECT
 
 class _BA_ProjectConfig(_BA_Config):
+    # project path -> (project dir mtime_ns, found .uproject), shared between config reloads
+    _uproject_cache: dict[Path, tuple[int, Path]] = {}
+
     def __init__(self):
         super().__init__("project")
         self._path: Path = Path()
@@ -123,13 +188,24 @@ class _BA_ProjectConfig(_BA_Config):
 
     @path.setter
     def path(self, value: Path):
-        if not value.exists():
+        try:
+            value_stat = value.stat()
+            mtime_ns: int = value_stat.st_mtime_ns
+            if not stat.S_ISDIR(value_stat.st_mode):
+                print(f"Project path '{value}' is not a directory!")
+        except OSError:
             print("Invalid project path:", value)
+            mtime_ns = -1
 
-        elif not value.is_dir():
-            print(f"Project path '{value}' is not a directory!")
+        uproject_path: Path | None = None
+        cached = self._uproject_cache.get(value)
+        if cached and cached[0] == mtime_ns:
+            uproject_path = cached[1]
+        else:
+            uproject_path = try_find_uproject_path(value)
+            if uproject_path:
+                self._uproject_cache[value] = (mtime_ns, uproject_path)
 
-        uproject_path: Path | None = try_find_uproject_path(value)
         if uproject_path:
             self._uproject = uproject_path
 
@@ -147,10 +223,8 @@ uproject: {self.uproject}"""
 
     @override
     def is_valid(self) -> bool:
-        return (self.path.exists()
-            and self.path.is_dir()
-            and self.uproject.exists()
-            and self.uproject.is_file()
+        return (path_kind(self.path) == "dir"
+            and path_kind(self.uproject) == "file"
             )
     
     @override
@@ -178,6 +252,7 @@ class _BA_SVNConfig(_BA_Config):
         self.exe: Path = Path(get_default_svn_path()).resolve()
         self._update_interval_in_seconds: int = 1
         self.cleanup_timeout_in_seconds: float = 1 * 60 * 60
+        self.cleanup_min_pristine_size_in_mb: int = 0 # 0 = always clean up
 
     @property
     def update_interval_in_seconds(self) -> int:
@@ -198,9 +273,7 @@ update interval in seconds: {self.update_interval_in_seconds}"""
 
     @override
     def is_valid(self) -> bool:
-        return (self.exe.exists()
-            and self.exe.is_file()
-            )
+        return path_kind(self.exe) == "file"
 
     @override
     def read_config(self, config: _RawConfig) -> bool:
@@ -208,7 +281,7 @@ update interval in seconds: {self.update_interval_in_seconds}"""
 
         if svn_exe_path:
             self.exe = Path(svn_exe_path).resolve()
-            if not self.exe.exists() or not self.exe.is_file():
+            if path_kind(self.exe) != "file":
                 return False
 
         update_interval_in_seconds: int | None = _get_config(config, self.category, "update_interval_in_seconds")
@@ -219,6 +292,10 @@ update interval in seconds: {self.update_interval_in_seconds}"""
         if cleanup_timeout_in_seconds != None and cleanup_timeout_in_seconds > 1.0:
             self.cleanup_timeout_in_seconds = cleanup_timeout_in_seconds
 
+        cleanup_min_pristine_size_in_mb: int | None = _get_config(config, self.category, "cleanup_min_pristine_size_in_mb")
+        if cleanup_min_pristine_size_in_mb != None and cleanup_min_pristine_size_in_mb >= 0:
+            self.cleanup_min_pristine_size_in_mb = cleanup_min_pristine_size_in_mb
+
         return True
 
 
@@ -234,17 +311,19 @@ class _BA_UnrealAutomationToolConfig(_BA_Config):
         self.build_type: str = DEFAULT_BUILD_TYPE
         self.output: Path = Path(BIN_DIR).resolve()
         self.build_log_file: Path = self.output / "build_log.txt"
+        self.extra_args: list[str] = []
 
     @override
     def __str__(self) -> str:
         return f"""exe: {self.exe}
 platform: {self.platform}
 build type: {self.build_type}
-output: {self.output}"""
+output: {self.output}
+extra args: {" ".join(self.extra_args)}"""
 
     @override
     def is_valid(self) -> bool:
-        return self.exe.exists() and self.exe.is_file()
+        return path_kind(self.exe) == "file"
 
     @override
     def read_config(self, config: _RawConfig) -> bool:
@@ -252,7 +331,7 @@ output: {self.output}"""
         if uat_exe:
             self.exe = Path(uat_exe).resolve()
 
-        if not self.exe.exists() or not self.exe.is_file():
+        if path_kind(self.exe) != "file":
             print("Invalid Unreal Build Tool executable path:", self.exe)
             return False
 
@@ -264,6 +343,11 @@ output: {self.output}"""
         if uat_build_type:
             self.build_type = uat_build_type
 
+        # split once here instead of on every build
+        uat_extra_args: list[str] | str | None = _get_config(config, self.category, "extra_args")
+        if uat_extra_args:
+            self.extra_args = list(uat_extra_args) if isinstance(uat_extra_args, list) else shlex.split(uat_extra_args)
+
         return True
 
 
@@ -276,11 +360,25 @@ class _BA_BuildExportConfig(_BA_Config):
         self.override_zip: bool = False
         self.output: Path = Path(DEFAULT_BUILD_OUTPUT_DIRECTORY).resolve()
         self.max_num_relevant_logs: int = 10
+        self.compress: bool = False # PAKs are already compressed, store them by default
+        self.compression_level: int = DEFAULT_COMPRESSION_LEVEL
+        self.compression_threads: int = 0 # 0 = all cores
 
     @override
     def __str__(self) -> str:
         return f"""override zip: {self.override_zip}
-output: {self.output}"""
+output: {self.output}
+compress: {self.compress}
+compression level: {self.compression_level}
+compression threads: {self.compression_threads or "all"}"""
+
+    @property
+    def compression_args(self) -> list[str]:
+        """7-Zip switches for the configured compression."""
+
+        threads: str = str(self.compression_threads) if self.compression_threads > 0 else "on"
+        level: int = self.compression_level if self.compress else 0
+        return [f"-mx={level}", f"-mmt={threads}"]
 
     @override
     def is_valid(self) -> bool:
@@ -300,6 +398,18 @@ output: {self.output}"""
         if max_num_relevant_logs and max_num_relevant_logs < 999:
             self.max_num_relevant_logs = max_num_relevant_logs
 
+        compress: bool | None = _get_config(config, self.category, "compress")
+        if compress != None:
+            self.compress = compress
+
+        compression_level: int | None = _get_config(config, self.category, "compression_level")
+        if compression_level != None and 0 <= compression_level <= 9:
+            self.compression_level = compression_level
+
+        compression_threads: int | None = _get_config(config, self.category, "compression_threads")
+        if compression_threads != None and compression_threads >= 0:
+            self.compression_threads = compression_threads
+
         return True
 
 
@@ -312,6 +422,8 @@ class _BA_SpecialLogKeywordsCommandsConfig(_BA_Config):
         self.is_enabled: bool = True
         self.make_dev_build: str = "#devbuild"
         self.ignore_build: str = "#ignorebuild"
+        self.all_commands: list[str] = self._get_all_commands()
+        self._pattern: re.Pattern[str] | None = None
 
     @override
     def __str__(self) -> str:
@@ -325,6 +437,8 @@ class _BA_SpecialLogKeywordsCommandsConfig(_BA_Config):
 
     @override
     def read_config(self, config: _RawConfig) -> bool:
+        self._pattern = None
+
         is_enabled: bool | None = _get_config(config, self.category, "enabled")
         if is_enabled != None:
             self.is_enabled = is_enabled
@@ -337,15 +451,29 @@ class _BA_SpecialLogKeywordsCommandsConfig(_BA_Config):
         if ignore_build:
             self.ignore_build = ignore_build
 
+        self.all_commands = self._get_all_commands()
         return self.is_valid()
 
-    @property
-    def all_commands(self) -> list[str]:
+    def _get_all_commands(self) -> list[str]:
         return [
             self.make_dev_build,
             self.ignore_build,
         ]
 
+    @property
+    def pattern(self) -> re.Pattern[str]:
+        """Matches any of the commands in a single pass.
+
+        Unlike searching each command on its own, matches don't overlap: when a command is a
+        prefix of another (e.g. "#dev" and "#dev-ignore") only the longest one is found there."""
+
+        if self._pattern is None:
+            # longest first, the regex alternation takes the first alternative that matches
+            commands: list[str] = sorted(self.all_commands, key=len, reverse=True)
+            self._pattern = re.compile("|".join(re.escape(command) for command in commands))
+
+        return self._pattern
+
         
 
 
@@ -353,12 +481,52 @@ class _BA_SpecialLogKeywordsCommandsConfig(_BA_Config):
 # SOUNDS
 
 class _BA_SoundsConfig(_BA_Config):
+    # sound directory -> (directory mtime_ns, found .wav files), shared between config reloads
+    _sound_files_cache: dict[Path, tuple[int, list[Path]]] = {}
+
     def __init__(self):
         super().__init__("sounds")
-        self.build_starting: list[Path] | Path = Path("./").resolve()
-        self.build_success: list[Path] | Path = Path("./").resolve()
-        self.build_fail: list[Path] | Path = Path("./").resolve()
-        self.build_unknown_error: list[Path] | Path = Path("./").resolve()
+        self.build_starting: list[Path] = [Path("./").resolve()]
+        self.build_success: list[Path] = [Path("./").resolve()]
+        self.build_fail: list[Path] = [Path("./").resolve()]
+        self.build_unknown_error: list[Path] = [Path("./").resolve()]
+
+        # flat lists of playable files, resolved on read_config
+        self.build_starting_files: list[Path] = []
+        self.build_success_files: list[Path] = []
+        self.build_fail_files: list[Path] = []
+        self.build_unknown_error_files: list[Path] = []
+
+    @classmethod
+    def _find_sound_files(cls, sounds: list[Path]) -> list[Path]:
+        """Returns every sound file on the given paths, directories are expanded to their .wav files."""
+
+        found_sounds: list[Path] = []
+
+        for path in sounds:
+            try:
+                path_stat = path.stat()
+            except OSError:
+                print(f"Sound path {path} do not exists.")
+                continue
+
+            if stat.S_ISREG(path_stat.st_mode):
+                found_sounds.append(path)
+                continue
+
+            if not stat.S_ISDIR(path_stat.st_mode):
+                print(f"Sound path {path} do not exists.")
+                continue
+
+            mtime_ns: int = path_stat.st_mtime_ns
+            cached = cls._sound_files_cache.get(path)
+            if not cached or cached[0] != mtime_ns:
+                cached = (mtime_ns, [Path(sound) for sound in iter_files_ext(path, ".wav")])
+                cls._sound_files_cache[path] = cached
+
+            found_sounds.extend(cached[1])
+
+        return found_sounds
 
     @override
     def __str__(self) -> str:
@@ -368,22 +536,12 @@ class _BA_SoundsConfig(_BA_Config):
             "build fail": self.build_fail,
             "build unknown error": self.build_unknown_error,
         }
-        text: str = ""
+        lines: list[str] = []
         for path_key in sounds_paths:
-            text += f"{path_key}: "
-            path: list[Path] | Path = sounds_paths[path_key]
-            if isinstance(path, Path):
-                text += path.name
-            else:
-                num_paths: int = len(path)
-                for i in range(num_paths):
-                    sub_path: Path = path[i]
-                    text += f"{sub_path.name}"
-                    if i < num_paths:
-                        text += ", "
-            text += "\n"
-
-        return text
+            names: str = ", ".join(path.name for path in sounds_paths[path_key])
+            lines.append(f"{path_key}: {names}")
+
+        return "\n".join(lines) + "\n"
 
     @override
     def is_valid(self) -> bool:
@@ -391,22 +549,28 @@ class _BA_SoundsConfig(_BA_Config):
 
     @override
     def read_config(self, config: _RawConfig) -> bool:
+        # a single path is accepted in the TOML, normalized to a one item list here
         sounds_build_starting:      list[str] | str | None = _get_config(config, self.category, "build_starting")
         sounds_build_success:       list[str] | str | None = _get_config(config, self.category, "build_success")
         sounds_build_fail:          list[str] | str | None = _get_config(config, self.category, "build_fail")
         sounds_build_unknown_error: list[str] | str | None = _get_config(config, self.category, "build_unknown_error")
 
         if sounds_build_starting:
-            self.build_starting = _get_path_or_paths(sounds_build_starting)
+            self.build_starting = _get_paths(sounds_build_starting)
 
         if sounds_build_success:
-            self.build_success = _get_path_or_paths(sounds_build_success)
+            self.build_success = _get_paths(sounds_build_success)
 
         if sounds_build_fail:
-            self.build_fail = _get_path_or_paths(sounds_build_fail)
+            self.build_fail = _get_paths(sounds_build_fail)
 
         if sounds_build_unknown_error:
-            self.build_unknown_error = _get_path_or_paths(sounds_build_unknown_error)
+            self.build_unknown_error = _get_paths(sounds_build_unknown_error)
+
+        self.build_starting_files = self._find_sound_files(self.build_starting)
+        self.build_success_files = self._find_sound_files(self.build_success)
+        self.build_fail_files = self._find_sound_files(self.build_fail)
+        self.build_unknown_error_files = self._find_sound_files(self.build_unknown_error)
 
         return self.is_valid()
 
@@ -424,6 +588,17 @@ class BuildAutomatorConfig:
         self.special_log_keywords: _BA_SpecialLogKeywordsCommandsConfig = _BA_SpecialLogKeywordsCommandsConfig()
         self.sounds: _BA_SoundsConfig = _BA_SoundsConfig()
 
+        # read in this order, the sub configs themselves are never replaced
+        self.all_configs: tuple[_BA_Config, ...] = (
+            self.project,
+            self.svn,
+            self.uat,
+            self.special_log_keywords,
+            self.build_export,
+            self.sounds,
+        )
+        self._invalid_configs: list[_BA_Config] | None = None
+
         if config:
             should_print_configs: bool | None = _get_config(config, "development", "print_config")
             if should_print_configs != None:
@@ -434,54 +609,39 @@ class BuildAutomatorConfig:
                     warn(f"Failed to read property config: {property_config.category}")
                     break
 
-    @property
-    def all_configs(self) -> list[_BA_Config]:
-        return [
-            self.project,
-            self.svn,
-            self.uat,
-            self.special_log_keywords,
-            self.build_export,
-            self.sounds,
-        ]
-
     @override
     def __str__(self) -> str:
-        text = f"should print configs: {self.should_print_configs}\n\n"
-
-        for config in self.all_configs:
-            text += config.get_section_string() + "\n\n"
+        parts: list[str] = [f"should print configs: {self.should_print_configs}"]
+        parts.extend(config.get_section_string() for config in self.all_configs)
 
-        return text
+        return "\n\n".join(parts) + "\n\n"
 
 
     def is_valid(self) -> bool:
-        return all(config.is_valid() for config in self.all_configs)
+        return len(self.get_invalid_configs()) == 0
 
 
     def get_invalid_configs(self) -> list[_BA_Config]:
-        invalid_configs: list[_BA_Config] = []
+        """Validates every config once, call clear_validation_cache to check again."""
 
-        for config in self.all_configs:
-            if not config.is_valid():
-                invalid_configs.append(config)
+        if self._invalid_configs is None:
+            self._invalid_configs = [config for config in self.all_configs if not config.is_valid()]
 
-        return invalid_configs
+        return self._invalid_configs
 
 
-    def get_invalid_configs_string(self) -> str:
-        text: str = ""
+    def clear_validation_cache(self):
+        self._invalid_configs = None
 
-        for config in self.get_invalid_configs():
-            text += config.get_section_string() + '\n'
 
-        return text
+    def get_invalid_configs_string(self) -> str:
+        return "".join(config.get_section_string() + "\n" for config in self.get_invalid_configs())
 
 
 def build_automator_load_config() -> BuildAutomatorConfig | None:
     config_path = Path(CONFIG_FILENAME).resolve()
 
-    if not config_path.exists() or not config_path.is_file():
+    if path_kind(config_path) != "file":
         print(f"Unable to find config file {CONFIG_FILENAME}.")
         return None
 